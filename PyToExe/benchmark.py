@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Benchmark für den Python to EXE Converter
+Misst den Converter selbst (nicht PyInstaller): läuft headless mit der Qt
+"offscreen" Plattform gegen ein Stub-PyInstaller, das aufgezeichnete Logs
+mit einstellbarer Rate wieder abspielt. Ergebnisse werden als JSON gespeichert.
+
+    python benchmark.py --output results.json
+    python benchmark.py --log build.log --rate 5000 --compare results.json
+"""
+
+import sys
+import os
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+
+# Muss vor dem Qt Import gesetzt sein
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Eigener Toolchain-Cache, damit der Stub nicht im Cache des Benutzers landet
+os.environ.setdefault(
+    "PYTOEXE_TOOLCHAIN_CACHE", os.path.join(tempfile.gettempdir(), "pytoexe_bench_toolchain.json")
+)
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QEventLoop, QTimer, QT_VERSION_STR
+
+import py2exe_converter
+from py2exe_converter import BuildWorker, MainWindow
+import stub_pyinstaller
+
+
+def install_stub(workspace, log_path, rate):
+    """Stellt das Stub-PyInstaller vor den echten - für diesen Prozess und alle Build-Prozesse"""
+    stub_dir, env = stub_pyinstaller.install_stub(workspace, log_path, rate)
+    sys.path.insert(0, stub_dir)
+    os.environ.update(env)
+
+
+def set_rate(rate):
+    """Setzt die Abspielrate des Stubs in Zeilen pro Sekunde (0 = unbegrenzt)"""
+    os.environ["PYTOEXE_STUB_RATE"] = str(rate)
+
+
+def make_script(workspace):
+    """Minimales Script, das gebaut wird"""
+    script = os.path.join(workspace, "app.py")
+    with open(script, "w", encoding="utf-8") as f:
+        f.write("print('hello')\n")
+    return script
+
+
+def wait_for(signal, timeout):
+    """Wartet im Qt Event-Loop, bis signal emittiert wurde"""
+    loop = QEventLoop()
+    result = []
+
+    def done(*args):
+        result.append(args)
+        loop.quit()
+
+    signal.connect(done)
+    QTimer.singleShot(int(timeout * 1000), loop.quit)
+    loop.exec()
+    signal.disconnect(done)
+    if not result:
+        raise TimeoutError("Zeitüberschreitung beim Warten auf den Build")
+    return result[0]
+
+
+def quiet_window(window, script, output_dir):
+    """Bereitet ein Fenster vor, das nach dem Build nichts öffnet oder verschiebt"""
+    for check in (window.organize_check, window.shortcut_check, window.open_folder_check):
+        check.setChecked(False)
+    window.script_input.setText(script)
+    window.output_input.setText(output_dir)
+    window.name_input.setText("app")
+
+
+def percentile(values, fraction):
+    """Einfaches Perzentil ohne numpy"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def bench_log_throughput(workspace, script):
+    """Zeilen pro Sekunde: nur Worker, und Worker + on_build_output"""
+    set_rate(0)
+    output_dir = os.path.join(workspace, "dist")
+    results = {}
+
+    # Nur der Worker (Signal-Zustellung ohne Log-Widget)
+    worker = BuildWorker(script, output_dir, "app", {})
+    lines = []
+    worker.output.connect(lines.append)
+    start = time.perf_counter()
+    worker.start()
+    wait_for(worker.finished, 600)
+    worker.wait()
+    seconds = time.perf_counter() - start
+    results["worker_only"] = {"lines": len(lines), "seconds": seconds, "lines_per_second": len(lines) / seconds}
+
+    # Worker mit dem echten Log-Widget des Hauptfensters
+    window = MainWindow()
+    worker = BuildWorker(script, output_dir, "app", {})
+    counter = [0]
+    worker.output.connect(window.on_build_output)
+    worker.output.connect(lambda _: counter.__setitem__(0, counter[0] + 1))
+    start = time.perf_counter()
+    worker.start()
+    wait_for(worker.finished, 600)
+    worker.wait()
+    seconds = time.perf_counter() - start
+    results["gui"] = {"lines": counter[0], "seconds": seconds, "lines_per_second": counter[0] / seconds}
+    window.close()
+
+    return results
+
+
+def bench_event_loop_latency(workspace, script, rate, interval_ms=10):
+    """Verspätung eines 10ms Timers, während ein Build ins Log schreibt"""
+    set_rate(rate)
+    window = MainWindow()
+    worker = BuildWorker(script, os.path.join(workspace, "dist"), "app", {})
+    worker.output.connect(window.on_build_output)
+
+    delays = []
+    last = [time.perf_counter()]
+
+    def tick():
+        now = time.perf_counter()
+        delays.append(max(0.0, (now - last[0]) * 1000 - interval_ms))
+        last[0] = now
+
+    timer = QTimer()
+    timer.timeout.connect(tick)
+    timer.start(interval_ms)
+    last[0] = time.perf_counter()
+    worker.start()
+    wait_for(worker.finished, 600)
+    timer.stop()
+    worker.wait()
+    window.close()
+
+    return {
+        "rate": rate,
+        "ticks": len(delays),
+        "mean_ms": sum(delays) / len(delays) if delays else 0.0,
+        "p95_ms": percentile(delays, 0.95),
+        "max_ms": max(delays) if delays else 0.0,
+    }
+
+
+def bench_cancel_latency(workspace, script, rate, runs=5):
+    """Zeit von "Abbrechen" bis zum finished Signal"""
+    set_rate(rate)
+    latencies = []
+    for _ in range(runs):
+        window = MainWindow()
+        quiet_window(window, script, os.path.join(workspace, "dist"))
+        window.start_build()
+        worker = window.worker
+
+        # Etwas Log laufen lassen, dann abbrechen
+        loop = QEventLoop()
+        QTimer.singleShot(300, loop.quit)
+        loop.exec()
+
+        start = time.perf_counter()
+        window.cancel_build()
+        wait_for(worker.finished, 60)
+        latencies.append((time.perf_counter() - start) * 1000)
+        worker.wait()
+        window.close()
+
+    return {
+        "rate": rate,
+        "runs": runs,
+        "mean_ms": sum(latencies) / len(latencies),
+        "max_ms": max(latencies),
+    }
+
+
+def bench_preflight(workspace, script, runs=5):
+    """Dauer von start_build() bis der Worker läuft (Prüfungen, Icon, Assets)"""
+    set_rate(0)
+    durations = []
+    for _ in range(runs):
+        window = MainWindow()
+        quiet_window(window, script, os.path.join(workspace, "dist"))
+        start = time.perf_counter()
+        window.start_build()
+        durations.append((time.perf_counter() - start) * 1000)
+        wait_for(window.worker.finished, 600)
+        window.worker.wait()
+        window.close()
+
+    return {
+        "runs": runs,
+        "mean_ms": sum(durations) / len(durations),
+        "min_ms": min(durations),
+        "max_ms": max(durations),
+    }
+
+
+def bench_organize_project(workspace, script, exe_mb, build_files, runs=3):
+    """organize_project auf einer großen synthetischen Build-Ausgabe"""
+    durations = []
+    window = MainWindow()
+    for run in range(runs):
+        output_dir = os.path.join(workspace, f"organize_{run}")
+        os.makedirs(output_dir)
+
+        exe_path = os.path.join(output_dir, "app.exe")
+        with open(exe_path, "wb") as f:
+            f.truncate(exe_mb * 1024 * 1024)
+
+        # build/ und .spec liegen im Arbeitsverzeichnis (= workspace)
+        build_dir = os.path.join(workspace, "build", "app")
+        os.makedirs(build_dir, exist_ok=True)
+        for i in range(build_files):
+            with open(os.path.join(build_dir, f"part_{i}.toc"), "w") as f:
+                f.write("x" * 256)
+        open(os.path.join(workspace, "app.spec"), "w").close()
+
+        start = time.perf_counter()
+        window.organize_project(exe_path, script, output_dir)
+        durations.append((time.perf_counter() - start) * 1000)
+    window.close()
+
+    return {
+        "exe_mb": exe_mb,
+        "build_files": build_files,
+        "runs": runs,
+        "mean_ms": sum(durations) / len(durations),
+        "max_ms": max(durations),
+    }
+
+
+def compare(results, previous_path):
+    """Vergleicht mit einem früheren Lauf und gibt die Änderungen aus"""
+    with open(previous_path, encoding="utf-8") as f:
+        previous = json.load(f)["results"]
+
+    print(f"\nVergleich mit {previous_path}:")
+    for name, values in results.items():
+        for key, value in flatten(values):
+            old = dict(flatten(previous.get(name, {}))).get(key)
+            if isinstance(value, float) and isinstance(old, (int, float)) and old:
+                print(f"  {name}.{key}: {old:.2f} → {value:.2f} ({(value - old) / old * 100:+.1f}%)")
+
+
+def flatten(values, prefix=""):
+    """Verschachtelte Ergebnisse als (schlüssel, wert) Paare"""
+    for key, value in values.items():
+        if isinstance(value, dict):
+            yield from flatten(value, f"{prefix}{key}.")
+        else:
+            yield f"{prefix}{key}", value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline-Benchmark für den Python to EXE Converter")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON Ergebnisdatei")
+    parser.add_argument("--log", help="Aufgezeichnetes PyInstaller Log zum Abspielen (sonst synthetisch)")
+    parser.add_argument("--lines", type=int, default=20000, help="Zeilen im synthetischen Log")
+    parser.add_argument("--rate", type=float, default=2000, help="Abspielrate für Latenz-Messungen (Zeilen/s)")
+    parser.add_argument("--exe-mb", type=int, default=200, help="Größe der synthetischen EXE für organize_project")
+    parser.add_argument("--build-files", type=int, default=2000, help="Dateien im synthetischen build/ Ordner")
+    parser.add_argument("--compare", help="Früheres Ergebnis zum Vergleichen")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    output_path = os.path.abspath(args.output)
+    old_cwd = os.getcwd()
+    workspace = tempfile.mkdtemp(prefix="pytoexe_bench_")
+
+    try:
+        # organize_project räumt build/ und .spec im Arbeitsverzeichnis auf
+        os.chdir(workspace)
+
+        log_path = os.path.abspath(os.path.join(old_cwd, args.log)) if args.log else os.path.join(workspace, "build.log")
+        if not args.log:
+            stub_pyinstaller.write_synthetic_log(log_path, args.lines)
+        install_stub(workspace, log_path, args.rate)
+        script = make_script(workspace)
+
+        results = {}
+        print("Log-Durchsatz...")
+        results["log_throughput"] = bench_log_throughput(workspace, script)
+        print("Event-Loop Latenz...")
+        results["event_loop_latency"] = bench_event_loop_latency(workspace, script, args.rate)
+        print("Abbruch-Latenz...")
+        results["cancel_latency"] = bench_cancel_latency(workspace, script, args.rate)
+        print("Pre-Flight...")
+        results["preflight"] = bench_preflight(workspace, script)
+        print("organize_project...")
+        results["organize_project"] = bench_organize_project(workspace, script, args.exe_mb, args.build_files)
+    finally:
+        os.chdir(old_cwd)
+        shutil.rmtree(workspace, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "qt": QT_VERSION_STR,
+            "converter": os.path.abspath(py2exe_converter.__file__),
+            "log": args.log or f"synthetisch ({args.lines} Zeilen)",
+            "rate": args.rate,
+        },
+        "results": results,
+    }
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    for name, values in results.items():
+        print(f"{name}:")
+        for key, value in flatten(values):
+            print(f"  {key}: {value:.2f}" if isinstance(value, float) else f"  {key}: {value}")
+    print(f"\nErgebnisse gespeichert: {output_path}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,462 @@
+#!/usr/bin/env python3
+"""
+Build-Server für den Python to EXE Converter
+Kleiner lokaler HTTP-Server um den Build-Kern (BuildWorker), damit CI-Rechner
+und Entwickler EXEs auf einer Maschine bauen lassen können, ohne die GUI zu öffnen.
+
+    python build_server.py --port 8765 --workers 2
+
+Endpunkte:
+    POST   /jobs?script=main.py&name=MyApp   ZIP des Projekts als Body, startet einen Job
+    GET    /jobs                             Alle Jobs mit Status
+    GET    /jobs/<id>                        Status eines Jobs
+    GET    /jobs/<id>/log                    Log live (chunked, oder SSE mit Accept: text/event-stream)
+    GET    /jobs/<id>/artifact               Fertige EXE (Ordner-Builds als ZIP)
+    DELETE /jobs/<id>                        Job abbrechen
+"""
+
+import os
+import io
+import json
+import time
+import uuid
+import queue
+import shutil
+import zipfile
+import argparse
+import itertools
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+from py2exe_converter import BuildWorker, plan_assets, estimate_build, record_build
+
+
+# Optionen, die als Query-Parameter (1/0) übergeben werden können
+FLAG_OPTIONS = ("onefile", "windowed", "clean", "profile", "dedup")
+
+
+class BuildJob:
+    """Ein Build-Auftrag mit Status und Log"""
+
+    def __init__(self, job_id, job_dir, script, name, options, estimate=None):
+        self.id = job_id
+        self.job_dir = job_dir
+        self.script = script
+        self.name = name
+        self.options = options
+        self.estimate = estimate
+        self.status = "queued"
+        self.message = ""
+        self.artifact = None
+        self.created = time.time()
+        self.started = None
+        self.ended = None
+        self.worker = None
+        self.lines = []
+        self.changed = threading.Condition()
+
+    @property
+    def done(self):
+        return self.status in ("succeeded", "failed", "cancelled")
+
+    def append(self, text):
+        with self.changed:
+            self.lines.append(text)
+            self.changed.notify_all()
+
+    def finish(self, status, message=""):
+        with self.changed:
+            self.status = status
+            self.message = message
+            self.ended = time.time()
+            self.changed.notify_all()
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "status": self.status,
+            "message": self.message,
+            "name": self.name,
+            "script": self.script,
+            "created": self.created,
+            "started": self.started,
+            "ended": self.ended,
+            "estimated_seconds": self.estimate["seconds"] if self.estimate else None,
+            "log_lines": len(self.lines),
+            "artifact": f"/jobs/{self.id}/artifact" if self.artifact else None,
+        }
+
+
+class BuildQueue:
+    """Warteschlange mit fester Anzahl paralleler Builds - geschätzt kürzeste zuerst"""
+
+    def __init__(self, jobs_dir, workers, max_queued, keep_jobs=100, max_age=24 * 3600, env=None):
+        self.jobs_dir = jobs_dir
+        self.jobs = {}
+        self.lock = threading.Lock()
+        self.max_queued = max_queued
+        self.reserved = 0
+        self.keep_jobs = keep_jobs
+        self.max_age = max_age
+        self.env = env or {}
+        # Ohne maxsize: abgebrochene Einträge bleiben liegen, zählen aber nicht als wartend
+        self.pending = queue.PriorityQueue()
+        self.order = itertools.count()
+        for index in range(workers):
+            threading.Thread(target=self.worker_loop, name=f"build-{index}", daemon=True).start()
+
+    def submit(self, bundle, params):
+        """Entpackt das Projekt-ZIP und reiht den Job ein"""
+        # Platz unter dem Lock reservieren - Entpacken und Schätzen dauern, parallele
+        # Anfragen würden die Grenze sonst gemeinsam überschreiten
+        with self.lock:
+            queued = sum(1 for job in self.jobs.values() if job.status == "queued")
+            if queued + self.reserved >= self.max_queued:
+                raise queue.Full()
+            self.reserved += 1
+        try:
+            return self._submit(bundle, params)
+        finally:
+            with self.lock:
+                self.reserved -= 1
+
+    def _submit(self, bundle, params):
+        self.prune()
+
+        job_id = uuid.uuid4().hex[:12]
+        job_dir = os.path.join(self.jobs_dir, job_id)
+        src_dir = os.path.join(job_dir, "src")
+        os.makedirs(src_dir)
+
+        try:
+            extract_bundle(bundle, src_dir)
+            script = params.get("script", "main.py")
+            script_path = safe_join(src_dir, script)
+            if not os.path.isfile(script_path):
+                raise ValueError(f"Script nicht im Bundle gefunden: {script}")
+
+            name = params.get("name") or os.path.splitext(os.path.basename(script))[0]
+            options = {key: params.get(key, "1" if key in ("onefile", "clean", "dedup") else "0") == "1"
+                       for key in FLAG_OPTIONS}
+            dedup = options.pop("dedup")
+            options["workdir"] = job_dir
+            # Eigener PyInstaller-Cache: --clean löscht sonst den gemeinsamen Cache parallel laufender Jobs
+            options["env"] = dict(self.env, PYINSTALLER_CONFIG_DIR=os.path.join(job_dir, "pyi_cache"))
+            if params.get("icon"):
+                options["icon"] = safe_join(src_dir, params["icon"])
+
+            # Daten-Ordner relativ zum Bundle, getrennt durch ;
+            data_dirs = [safe_join(src_dir, d) for d in params.get("data", "").split(";") if d.strip()]
+            if data_dirs:
+                options["assets"] = plan_assets(data_dirs, script_path, {}, dedup)
+
+            estimate = estimate_build(script_path, options["onefile"], data_dirs, options["clean"])
+        except Exception:
+            shutil.rmtree(job_dir, ignore_errors=True)
+            raise
+
+        job = BuildJob(job_id, job_dir, script_path, name, options, estimate)
+        with self.lock:
+            self.jobs[job_id] = job
+        # Bei gleicher Schätzung gilt die Eingangsreihenfolge
+        self.pending.put((estimate["seconds"], next(self.order), job))
+        return job
+
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def all(self):
+        with self.lock:
+            return list(self.jobs.values())
+
+    def cancel(self, job):
+        """Bricht einen wartenden oder laufenden Job ab"""
+        with self.lock:
+            if job.status == "queued":
+                job.finish("cancelled", "Abgebrochen")
+            elif job.status == "running":
+                job.worker.cancel()
+
+    def prune(self):
+        """Entfernt fertige Jobs, die zu alt sind oder über keep_jobs hinausgehen"""
+        now = time.time()
+        with self.lock:
+            finished = sorted((job for job in self.jobs.values() if job.done), key=lambda job: job.ended)
+            expired = [job for job in finished if now - job.ended > self.max_age]
+            expired += [job for job in finished[:max(len(finished) - self.keep_jobs, 0)] if job not in expired]
+            for job in expired:
+                del self.jobs[job.id]
+        for job in expired:
+            shutil.rmtree(job.job_dir, ignore_errors=True)
+
+    def worker_loop(self):
+        while True:
+            _, _, job = self.pending.get()
+            try:
+                self.run_job(job)
+            except Exception as e:
+                # Der Worker-Thread muss weiterlaufen, sonst sinkt die Zahl paralleler Builds
+                job.finish("failed", f"Interner Fehler: {e}")
+            self.prune()
+
+    def run_job(self, job):
+        """Führt den Build synchron im aktuellen Thread aus"""
+        dist_dir = os.path.join(job.job_dir, "dist")
+
+        # Status und Worker gemeinsam setzen, damit ein Abbruch nicht dazwischen verloren geht
+        with self.lock:
+            if job.status != "queued":
+                return
+            job.worker = BuildWorker(job.script, dist_dir, job.name, job.options)
+            job.status = "running"
+            job.started = time.time()
+
+        # run() direkt aufrufen: Signale werden im selben Thread zugestellt
+        result = []
+        job.worker.output.connect(job.append)
+        job.worker.finished.connect(lambda success, message: result.append((success, message)))
+        job.worker.run()
+
+        success, message = result[0] if result else (False, "Kein Ergebnis")
+        if success:
+            job.artifact = find_artifact(dist_dir, job.name)
+            # Profilierte Builds sind um ein Vielfaches langsamer und verfälschen die Historie
+            if job.artifact and job.worker.duration and not job.options.get("profile"):
+                record_build(job.estimate, job.worker.duration, os.path.getsize(job.artifact), job.worker.peak_memory)
+            job.finish("succeeded", os.path.basename(job.artifact or ""))
+        elif job.worker._cancelled:
+            job.finish("cancelled", message)
+        else:
+            job.finish("failed", message)
+
+
+def safe_join(base, relative):
+    """Pfad im Bundle auflösen, ohne aus dem Ordner herauszukommen"""
+    path = os.path.abspath(os.path.join(base, relative))
+    if not path.startswith(os.path.abspath(base) + os.sep):
+        raise ValueError(f"Ungültiger Pfad: {relative}")
+    return path
+
+
+def extract_bundle(bundle, target):
+    """Entpackt das Projekt-ZIP mit Schutz vor Pfaden außerhalb des Ziels"""
+    with zipfile.ZipFile(io.BytesIO(bundle)) as archive:
+        for member in archive.namelist():
+            safe_join(target, member)
+        archive.extractall(target)
+
+
+def find_artifact(dist_dir, name):
+    """Sucht das Build-Ergebnis: Onefile-EXE oder Ordner (wird gezippt)"""
+    for candidate in (name + ".exe", name):
+        path = os.path.join(dist_dir, candidate)
+        if os.path.isfile(path):
+            return path
+
+    folder = os.path.join(dist_dir, name)
+    if os.path.isdir(folder):
+        return shutil.make_archive(folder, "zip", dist_dir, name)
+    return None
+
+
+class BuildRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "PyToExeBuildServer/1.0"
+
+    @property
+    def builds(self):
+        return self.server.builds
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def authorized(self):
+        token = self.server.token
+        if token and self.headers.get("Authorization") != f"Bearer {token}":
+            self.send_json(401, {"error": "Nicht autorisiert"})
+            return False
+        return True
+
+    def send_json(self, code, data):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def route(self):
+        """Zerlegt den Pfad in (job, unterpfad) und prüft den Job"""
+        parts = [p for p in urlparse(self.path).path.split("/") if p]
+        if not parts or parts[0] != "jobs":
+            self.send_json(404, {"error": "Nicht gefunden"})
+            return None, None, False
+        if len(parts) == 1:
+            return None, None, True
+        job = self.builds.get(parts[1])
+        if job is None:
+            self.send_json(404, {"error": "Job nicht gefunden"})
+            return None, None, False
+        return job, parts[2] if len(parts) > 2 else None, True
+
+    def do_POST(self):
+        if not self.authorized():
+            return
+        job, _, ok = self.route()
+        if not ok:
+            return
+        if job is not None:
+            self.send_json(405, {"error": "Methode nicht erlaubt"})
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        if length <= 0 or length > self.server.max_bundle_bytes:
+            self.send_json(413, {"error": "Bundle fehlt oder ist zu groß"})
+            return
+
+        params = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+        try:
+            job = self.builds.submit(self.rfile.read(length), params)
+        except queue.Full:
+            self.send_json(503, {"error": "Warteschlange voll"})
+            return
+        except (ValueError, zipfile.BadZipFile) as e:
+            self.send_json(400, {"error": str(e)})
+            return
+        except Exception as e:
+            self.send_json(500, {"error": f"Interner Fehler: {e}"})
+            return
+        self.send_json(201, job.to_dict())
+
+    def do_GET(self):
+        if not self.authorized():
+            return
+        job, sub, ok = self.route()
+        if not ok:
+            return
+
+        if job is None:
+            self.send_json(200, [j.to_dict() for j in self.builds.all()])
+        elif sub is None:
+            self.send_json(200, job.to_dict())
+        elif sub == "log":
+            self.stream_log(job)
+        elif sub == "artifact":
+            self.send_artifact(job)
+        else:
+            self.send_json(404, {"error": "Nicht gefunden"})
+
+    def do_DELETE(self):
+        if not self.authorized():
+            return
+        job, _, ok = self.route()
+        if not ok:
+            return
+        if job is None:
+            self.send_json(405, {"error": "Methode nicht erlaubt"})
+            return
+        self.builds.cancel(job)
+        self.send_json(202, job.to_dict())
+
+    def stream_log(self, job):
+        """Schickt das Log live, bis der Job fertig ist"""
+        sse = "text/event-stream" in self.headers.get("Accept", "")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream" if sse else "text/plain; charset=utf-8")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        sent = 0
+        try:
+            while True:
+                with job.changed:
+                    while sent == len(job.lines) and not job.done:
+                        job.changed.wait(timeout=15)
+                    lines = job.lines[sent:]
+                    done = job.done
+                sent += len(lines)
+
+                if sse:
+                    text = "".join("data: " + line.rstrip("\n") + "\n\n" for line in lines)
+                    if done:
+                        text += f"event: end\ndata: {json.dumps(job.to_dict())}\n\n"
+                else:
+                    text = "".join(lines)
+                if text:
+                    self.write_chunk(text.encode("utf-8"))
+                if done:
+                    break
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def write_chunk(self, data):
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def send_artifact(self, job):
+        if not job.artifact or not os.path.isfile(job.artifact):
+            self.send_json(409, {"error": "Kein Artefakt vorhanden", "status": job.status})
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(os.path.getsize(job.artifact)))
+        self.send_header("Content-Disposition", f'attachment; filename="{os.path.basename(job.artifact)}"')
+        self.end_headers()
+        with open(job.artifact, "rb") as f:
+            shutil.copyfileobj(f, self.wfile)
+
+
+def create_server(host="127.0.0.1", port=8765, jobs_dir="build_jobs", workers=2, max_queued=20,
+                  max_bundle_mb=200, token=None, quiet=False, keep_jobs=100, max_age_hours=24, env=None):
+    """Erstellt den Server (port=0 wählt einen freien Port); gestartet wird mit serve_forever()"""
+    os.makedirs(jobs_dir, exist_ok=True)
+
+    server = ThreadingHTTPServer((host, port), BuildRequestHandler)
+    server.daemon_threads = True
+    server.builds = BuildQueue(
+        os.path.abspath(jobs_dir), workers, max_queued, keep_jobs, max_age_hours * 3600, env
+    )
+    server.token = token
+    server.quiet = quiet
+    server.max_bundle_bytes = max_bundle_mb * 1024 * 1024
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lokaler Build-Server für den Python to EXE Converter")
+    parser.add_argument("--host", default="127.0.0.1", help="Adresse (Standard: nur lokal)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=2, help="Parallele Builds")
+    parser.add_argument("--max-queued", type=int, default=20, help="Maximale Anzahl wartender Jobs")
+    parser.add_argument("--max-bundle-mb", type=int, default=200, help="Maximale Größe eines Projekt-ZIPs")
+    parser.add_argument("--jobs-dir", default=os.path.join(os.getcwd(), "build_jobs"), help="Ordner für Jobs und Artefakte")
+    parser.add_argument("--keep-jobs", type=int, default=100, help="Anzahl fertiger Jobs, die behalten werden")
+    parser.add_argument("--max-age-hours", type=float, default=24, help="Fertige Jobs danach löschen")
+    parser.add_argument("--token", default=os.environ.get("PYTOEXE_SERVER_TOKEN"), help="Bearer-Token für alle Anfragen")
+    parser.add_argument("--quiet", action="store_true", help="Keine Zugriffs-Logs")
+    args = parser.parse_args()
+
+    server = create_server(
+        args.host, args.port, args.jobs_dir, args.workers, args.max_queued, args.max_bundle_mb,
+        args.token, args.quiet, args.keep_jobs, args.max_age_hours
+    )
+
+    print(f"Build-Server läuft auf http://{args.host}:{args.port} ({args.workers} parallele Builds)")
+    if args.host not in ("127.0.0.1", "localhost") and not args.token:
+        print("⚠️ Server ist ohne --token von außen erreichbar")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Selbsttest für den Build-Server
+Startet den Server auf einem freien localhost-Port gegen das Stub-PyInstaller,
+schickt ein Projekt-ZIP, liest das Log (chunked und SSE), lädt die EXE herunter
+und prüft Abbruch, Warteschlangen-Limit, Fehlerbehandlung und Aufräumen.
+
+    python build_server_selftest.py
+"""
+
+import os
+import io
+import json
+import time
+import shutil
+import zipfile
+import tempfile
+import threading
+import http.client
+
+# Eigener Toolchain-Cache und Build-Verlauf, damit der Test nichts beim Benutzer ablegt.
+# Muss vor dem Import des Converters gesetzt sein.
+os.environ.setdefault(
+    "PYTOEXE_TOOLCHAIN_CACHE", os.path.join(tempfile.gettempdir(), "pytoexe_selftest_toolchain.json")
+)
+os.environ.setdefault(
+    "PYTOEXE_BUILD_HISTORY", os.path.join(tempfile.gettempdir(), "pytoexe_selftest_history.json")
+)
+
+import stub_pyinstaller
+import build_server
+from build_server import create_server
+
+
+def make_bundle():
+    """Minimales Projekt als ZIP"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("main.py", "print('hello')\n")
+        zf.writestr("assets/readme.txt", "daten\n")
+    return buffer.getvalue()
+
+
+def request(port, method, path, body=None, headers=None):
+    """Eine Anfrage, liefert (status, body)"""
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    conn.request(method, path, body=body, headers=headers or {})
+    response = conn.getresponse()
+    data = response.read()
+    conn.close()
+    return response.status, data
+
+
+def submit(port, bundle, query="script=main.py&name=app"):
+    status, data = request(port, "POST", f"/jobs?{query}", bundle, {"Content-Type": "application/zip"})
+    return status, json.loads(data)
+
+
+def wait_done(port, job_id, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        _, data = request(port, "GET", f"/jobs/{job_id}")
+        job = json.loads(data)
+        if job["status"] in ("succeeded", "failed", "cancelled"):
+            return job
+        time.sleep(0.1)
+    raise TimeoutError(f"Job {job_id} wurde nicht fertig")
+
+
+def check(condition, message):
+    if not condition:
+        raise AssertionError(message)
+    print(f"✅ {message}")
+
+
+def run_checks(port, server, bundle, lines):
+    # Build mit Daten-Ordner, Log per chunked Transfer
+    status, job = submit(port, bundle, "script=main.py&name=app&data=assets")
+    check(status == 201, "Job angenommen")
+    status, log = request(port, "GET", f"/jobs/{job['id']}/log")
+    check(status == 200 and log.decode("utf-8").count("INFO:") >= lines // 2, "Log vollständig gestreamt (chunked)")
+    job = wait_done(port, job["id"])
+    check(job["status"] == "succeeded", f"Build erfolgreich ({job['message']})")
+    report = "".join(server.builds.get(job["id"]).lines)
+    check("Asset-Bericht" in report and "Text: 1 Dateien" in report, "Asset-Launcher lief gegen das Stub-PyInstaller")
+
+    status, artifact = request(port, "GET", job["artifact"])
+    check(status == 200 and artifact.startswith(b"MZ"), "Artefakt heruntergeladen")
+
+    job_dir = os.path.join(server.builds.jobs_dir, job["id"])
+    cache_dir = server.builds.get(job["id"]).options["env"]["PYINSTALLER_CONFIG_DIR"]
+    check(cache_dir == os.path.join(job_dir, "pyi_cache"), "Eigener PyInstaller-Cache pro Job")
+
+    # Log per SSE
+    status, log = request(port, "GET", f"/jobs/{job['id']}/log", headers={"Accept": "text/event-stream"})
+    check(status == 200 and log.startswith(b"data: "), "Log als Server-Sent Events")
+
+    # Abbruch eines laufenden Jobs
+    _, job = submit(port, bundle)
+    while json.loads(request(port, "GET", f"/jobs/{job['id']}")[1])["status"] == "queued":
+        time.sleep(0.02)
+    status, _ = request(port, "DELETE", f"/jobs/{job['id']}")
+    check(status == 202 and wait_done(port, job["id"])["status"] == "cancelled", "Laufender Job abgebrochen")
+
+    # Abgebrochene wartende Jobs belegen keinen Platz in der Warteschlange
+    blocker = submit(port, bundle)[1]
+    queued = [submit(port, bundle)[1] for _ in range(server.builds.max_queued)]
+    check(submit(port, bundle)[0] == 503, "Volle Warteschlange liefert 503")
+    for entry in queued:
+        request(port, "DELETE", f"/jobs/{entry['id']}")
+    status, extra = submit(port, bundle)
+    check(status == 201, "Abgebrochene Jobs geben ihren Platz frei")
+    request(port, "DELETE", f"/jobs/{blocker['id']}")
+    request(port, "DELETE", f"/jobs/{extra['id']}")
+    wait_done(port, blocker["id"])
+    wait_done(port, extra["id"])
+
+    # Parallele Anfragen überschreiten --max-queued nicht
+    blocker = submit(port, bundle)[1]
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(submit(port, bundle)))
+               for _ in range(server.builds.max_queued * 3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    accepted = [job for status, job in results if status == 201]
+    check(len(accepted) <= server.builds.max_queued, f"Parallele Anfragen: {len(accepted)} angenommen")
+    for entry in accepted + [blocker]:
+        request(port, "DELETE", f"/jobs/{entry['id']}")
+        wait_done(port, entry["id"])
+
+    # Ein Fehler nach dem Build beendet den Job, nicht den Worker-Thread
+    original = build_server.find_artifact
+    build_server.find_artifact = lambda *args: 1 / 0
+    try:
+        job = wait_done(port, submit(port, bundle)[1]["id"])
+    finally:
+        build_server.find_artifact = original
+    check(job["status"] == "failed" and "Interner Fehler" in job["message"], "Interner Fehler beendet den Job")
+    job = wait_done(port, submit(port, bundle)[1]["id"])
+    check(job["status"] == "succeeded", "Worker-Thread läuft danach weiter")
+
+    # Aufbewahrung: nur keep_jobs fertige Jobs bleiben
+    server.builds.prune()
+    remaining = json.loads(request(port, "GET", "/jobs")[1])
+    folders = os.listdir(server.builds.jobs_dir)
+    check(len(remaining) <= server.builds.keep_jobs and len(folders) <= server.builds.keep_jobs,
+          f"Alte Jobs aufgeräumt ({len(remaining)} behalten)")
+
+
+def main():
+    workspace = tempfile.mkdtemp(prefix="pytoexe_selftest_")
+    old_cwd = os.getcwd()
+    # Etwa 2,5 Sekunden pro Build - lang genug, um Jobs wartend zu erwischen
+    lines = 5000
+    try:
+        os.chdir(workspace)
+        log_path = os.path.join(workspace, "build.log")
+        stub_pyinstaller.write_synthetic_log(log_path, lines)
+        _, env = stub_pyinstaller.install_stub(workspace, log_path, rate=2000)
+
+        server = create_server(
+            port=0, jobs_dir=os.path.join(workspace, "jobs"), workers=1, max_queued=3,
+            quiet=True, keep_jobs=2, env=env
+        )
+        port = server.server_address[1]
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        print(f"Server läuft auf Port {port}")
+
+        try:
+            run_checks(port, server, make_bundle(), lines)
+        finally:
+            server.shutdown()
+            server.server_close()
+    finally:
+        os.chdir(old_cwd)
+        shutil.rmtree(workspace, ignore_errors=True)
+    print("Selbsttest bestanden")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,18 +8,142 @@ import sys
 import os
 import subprocess
 import threading
+import pstats
+import json
+import time
+import hashlib
+import tempfile
+import site
+import shutil
+import importlib
+import importlib.util
+import importlib.metadata
+import ast
+import re
+
+# Benötigte Tools: Name -> (Modul, Distribution / pip-Paket)
+TOOLCHAIN_PACKAGES = {
+    "PyQt6": ("PyQt6", "PyQt6"),
+    "PyInstaller": ("PyInstaller", "pyinstaller"),
+    "Pillow": ("PIL", "Pillow"),
+}
+
+TOOLCHAIN_CACHE = os.environ.get("PYTOEXE_TOOLCHAIN_CACHE") or os.path.join(
+    os.path.expanduser("~"), ".pytoexe", "toolchain.json"
+)
+
+# Lokales Wheel-Verzeichnis für Offline-Installationen
+WHEELHOUSE = os.environ.get("PYTOEXE_WHEELHOUSE") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "wheelhouse"
+)
+
+
+class Toolchain:
+    """Ermittelt PyQt6, PyInstaller, Pillow und UPX einmalig und cached Versionen und Pfade"""
+    
+    def __init__(self, cache_path=TOOLCHAIN_CACHE, wheelhouse=WHEELHOUSE):
+        self.cache_path = cache_path
+        self.wheelhouse = wheelhouse
+        self.tools = None
+        self._fingerprint = None
+    
+    def fingerprint(self):
+        """Interpreter und Änderungszeit der Paket-Ordner - ändert sich bei jeder (De-)Installation"""
+        dirs = list(getattr(site, "getsitepackages", lambda: [])())
+        dirs.append(site.getusersitepackages())
+        dirs += [p for p in os.environ.get("PYTHONPATH", "").split(os.pathsep) if p]
+        
+        mtimes = {}
+        for path in dirs:
+            try:
+                mtimes[path] = os.stat(path).st_mtime
+            except OSError:
+                pass
+        return {"executable": sys.executable, "version": sys.version, "paths": mtimes}
+    
+    def resolve(self, refresh=False):
+        """Liefert {Name: {"version", "path"} oder None} - aus Speicher, Cache oder neu ermittelt"""
+        fingerprint = self.fingerprint()
+        if not refresh and self.tools is not None and fingerprint == self._fingerprint:
+            return self.tools
+        
+        if not refresh:
+            try:
+                with open(self.cache_path, encoding="utf-8") as f:
+                    cache = json.load(f)
+                if cache.get("fingerprint") == fingerprint:
+                    self.tools, self._fingerprint = cache["tools"], fingerprint
+                    return self.tools
+            except (OSError, ValueError, KeyError):
+                pass
+        
+        importlib.invalidate_caches()
+        tools = {}
+        for name, (module, distribution) in TOOLCHAIN_PACKAGES.items():
+            tools[name] = self._find_package(module, distribution)
+        tools["UPX"] = self._find_upx()
+        
+        self.tools, self._fingerprint = tools, fingerprint
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(self.cache_path, "w", encoding="utf-8") as f:
+                json.dump({"fingerprint": fingerprint, "tools": tools}, f, indent=2)
+        except OSError:
+            pass
+        return tools
+    
+    def get(self, name):
+        return self.resolve().get(name)
+    
+    def _find_package(self, module, distribution):
+        """Version und Pfad ohne Import und ohne Subprozess"""
+        try:
+            spec = importlib.util.find_spec(module)
+        except (ImportError, ValueError):
+            return None
+        if spec is None:
+            return None
+        # Ohne Metadaten (z.B. Quellcode-Checkout im PYTHONPATH) ist das Paket trotzdem nutzbar
+        try:
+            version = importlib.metadata.version(distribution)
+        except importlib.metadata.PackageNotFoundError:
+            version = None
+        return {"version": version, "path": os.path.dirname(spec.origin or "") or None}
+    
+    def _find_upx(self):
+        """UPX ist optional: im PATH oder im Wheelhouse unter upx/"""
+        path = shutil.which("upx") or shutil.which("upx", path=os.path.join(self.wheelhouse, "upx"))
+        if not path:
+            return None
+        try:
+            result = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10)
+            version = result.stdout.split("\n")[0].replace("upx", "").strip()
+        except (OSError, subprocess.SubprocessError):
+            version = None
+        return {"version": version, "path": path}
+    
+    def install(self, names):
+        """Installiert Pakete - offline aus dem Wheelhouse, falls vorhanden"""
+        cmd = [sys.executable, "-m", "pip", "install"]
+        if os.path.isdir(self.wheelhouse):
+            cmd += ["--no-index", "--find-links", self.wheelhouse]
+        cmd += [TOOLCHAIN_PACKAGES[name][1] for name in names]
+        try:
+            subprocess.check_call(cmd)
+        finally:
+            self.resolve(refresh=True)
+
+
+toolchain = Toolchain()
+
 
 # Abhängigkeiten prüfen
 def check_dependencies():
-    missing = []
-    try:
-        import PyQt6
-    except ImportError:
-        missing.append("PyQt6")
+    missing = [name for name in ("PyQt6",) if not toolchain.get(name)]
     
     if missing:
         print(f"Installiere fehlende Pakete: {', '.join(missing)}")
-        subprocess.check_call([sys.executable, "-m", "pip", "install"] + missing)
+        toolchain.install(missing)
         print("Installation abgeschlossen. Bitte Programm neu starten.")
         sys.exit(0)
 
@@ -29,9 +153,9 @@ from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QFileDialog, QLineEdit, QTextEdit,
     QProgressBar, QCheckBox, QGroupBox, QGridLayout, QMessageBox,
-    QFrame
+    QFrame, QSpinBox
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QProcess
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal, QProcess
 from PyQt6.QtGui import QFont, QColor, QTextCursor
 
 
@@ -162,6 +286,9 @@ QLabel#title_label {
     font-weight: bold;
     color: #4ec9b0;
 }
+QLabel#estimate_label {
+    color: #9cdcfe;
+}
 QLabel#subtitle_label {
     color: #808080;
     font-size: 9pt;
@@ -173,6 +300,596 @@ QFrame#separator {
 """
 
 
+# Zuordnung von Profil-Einträgen zu PyInstaller-Subsystemen (Pfad-Fragment -> Gruppe)
+PROFILE_SUBSYSTEMS = [
+    ("/PyInstaller/lib/modulegraph/", "Modul-Graph"),
+    ("/PyInstaller/depend/analysis.py", "Modul-Graph"),
+    ("/PyInstaller/depend/imphook", "Modul-Graph"),
+    ("/PyInstaller/depend/bindepend.py", "Binär-Abhängigkeiten"),
+    ("/PyInstaller/depend/dylib.py", "Binär-Abhängigkeiten"),
+    ("/PyInstaller/utils/win32/", "Binär-Abhängigkeiten"),
+    ("/PyInstaller/archive/", "Kompression"),
+    ("/PyInstaller/building/", "Build-Schritte"),
+    ("/PyInstaller/", "PyInstaller (sonstiges)"),
+]
+
+
+def classify_profile_entry(filename, funcname):
+    """Ordnet eine Profil-Funktion einem Hook oder Subsystem zu"""
+    path = filename.replace("\\", "/")
+    
+    # Hooks einzeln ausweisen, damit man weiß welches Paket bremst
+    # (ohne Paket-__init__ und Runtime-Hooks - die laufen erst in der EXE)
+    if "/PyInstaller/hooks/" in path or "/_pyinstaller_hooks_contrib/" in path:
+        hook_name = os.path.splitext(os.path.basename(path))[0]
+        if hook_name != "__init__" and "/rthooks/" not in path:
+            return f"Hook: {hook_name}"
+    
+    # Built-ins (zlib.compress usw.) haben keinen Dateipfad
+    if filename == "~":
+        if "zlib" in funcname or "compress" in funcname:
+            return "Kompression"
+        return "Sonstiges"
+    
+    for fragment, group in PROFILE_SUBSYSTEMS:
+        if fragment in path:
+            return group
+    return "Sonstiges"
+
+
+# Einstiegspunkte einer Hook-Datei: Ausführen des Moduls und die hook() Funktion
+HOOK_ENTRY_POINTS = ("<module>", "hook")
+
+
+def profile_subsystem(group):
+    """Subsystem für die Rangliste - alle Hooks zusammen als eine Gruppe"""
+    return "Hooks" if group.startswith("Hook: ") else group
+
+
+def attribute_to_callers(stats, classified):
+    """Verteilt Funktionen ohne eigenes Subsystem (Standardbibliothek, Built-ins) anteilig
+    nach Aufrufzeit auf das Subsystem des nächsten PyInstaller-Aufrufers.
+    Liefert {Funktion: {Subsystem: Anteil}}"""
+    shares = {}
+    visiting = set()
+    for start in stats.stats:
+        stack = [(start, False)]
+        while stack:
+            func, expanded = stack.pop()
+            if func in shares:
+                continue
+            group = profile_subsystem(classified[func])
+            if group != "Sonstiges":
+                shares[func] = {group: 1.0}
+                continue
+            
+            callers = stats.stats[func][4]
+            if not expanded:
+                # Erst alle Aufrufer auflösen, Zyklen werden übersprungen
+                visiting.add(func)
+                stack.append((func, True))
+                stack.extend((caller, False) for caller in callers
+                             if caller not in shares and caller not in visiting)
+                continue
+            
+            visiting.discard(func)
+            result = {}
+            weight = 0.0
+            for caller, (_, _, _, cumtime) in callers.items():
+                if caller in shares and cumtime > 0:
+                    weight += cumtime
+                    for key, share in shares[caller].items():
+                        result[key] = result.get(key, 0.0) + cumtime * share
+            shares[func] = {key: value / weight for key, value in result.items()} if weight else {"Sonstiges": 1.0}
+    return shares
+
+
+def summarize_profile(profile_path, limit=10):
+    """Erstellt eine Rangliste der Hotspots gruppiert nach Hook/Subsystem"""
+    stats = pstats.Stats(profile_path)
+    
+    hooks = {}
+    functions = []
+    classified = {}
+    for func, (_, _, tottime, cumtime, _) in stats.stats.items():
+        filename, lineno, funcname = func
+        group = classified[func] = classify_profile_entry(filename, funcname)
+        functions.append((tottime, f"{os.path.basename(filename)}:{lineno}({funcname})", group))
+        
+        # Hooks nach Gesamtzeit, damit auch collect_submodules & Co. dem Hook zugerechnet werden
+        if group.startswith("Hook: ") and funcname in HOOK_ENTRY_POINTS:
+            hooks[group] = hooks.get(group, 0.0) + cumtime
+    
+    # Subsysteme nach Eigenzeit - inklusive der Standardbibliothek, die sie aufrufen
+    groups = {}
+    for func, func_shares in attribute_to_callers(stats, classified).items():
+        tottime = stats.stats[func][2]
+        for group, share in func_shares.items():
+            groups[group] = groups.get(group, 0.0) + tottime * share
+    
+    total = stats.total_tt or 1.0
+    lines = [f"Profil-Zusammenfassung (Gesamt: {stats.total_tt:.2f}s)"]
+    
+    lines.append("Langsamste Hooks (inkl. aufgerufener Helfer):")
+    ranked = sorted(hooks.items(), key=lambda item: item[1], reverse=True)
+    for rank, (group, seconds) in enumerate(ranked[:limit], 1):
+        lines.append(f"  {rank:2d}. {group:<40} {seconds:8.2f}s  {seconds / total * 100:5.1f}%")
+    
+    lines.append("Subsysteme (Eigenzeit inkl. aufgerufener Standardbibliothek):")
+    ranked = sorted(groups.items(), key=lambda item: item[1], reverse=True)
+    for rank, (group, seconds) in enumerate(ranked[:limit], 1):
+        lines.append(f"  {rank:2d}. {group:<40} {seconds:8.2f}s  {seconds / total * 100:5.1f}%")
+    
+    lines.append("Langsamste Funktionen (Eigenzeit):")
+    functions.sort(reverse=True)
+    for tottime, name, group in functions[:limit]:
+        lines.append(f"  {tottime:8.2f}s  {name}  [{group}]")
+    
+    return lines
+
+
+# Typische Namen von Daten-Ordnern neben dem Script
+ASSET_DIR_NAMES = [
+    "assets", "data", "resources", "res", "images", "img", "icons",
+    "fonts", "sounds", "audio", "static", "templates", "locale", "ui"
+]
+
+# Asset-Klassen: Schlüssel -> (Anzeigename, Dateiendungen, Standard-Kompressionsstufe)
+# Bereits komprimierte Formate werden standardmäßig nicht erneut komprimiert.
+ASSET_CLASSES = {
+    "compressed": ("Bereits komprimiert", {
+        ".png", ".jpg", ".jpeg", ".gif", ".webp", ".ico", ".mp3", ".ogg", ".m4a",
+        ".flac", ".mp4", ".webm", ".zip", ".gz", ".bz2", ".xz", ".7z", ".rar",
+        ".woff", ".woff2", ".pdf", ".docx", ".xlsx", ".jar", ".whl"
+    }, 0),
+    "text": ("Text", {
+        ".txt", ".json", ".csv", ".xml", ".html", ".htm", ".css", ".js", ".svg",
+        ".md", ".ini", ".cfg", ".yaml", ".yml", ".toml", ".qss", ".ui", ".po", ".sql"
+    }, 9),
+    "other": ("Sonstige", set(), 6),
+}
+
+# Wird statt "python -m PyInstaller" gestartet, wenn Assets gebündelt werden.
+# Setzt pro Asset die zlib-Stufe und speichert identische Dateien im
+# Onefile-Archiv nur einmal (mehrere TOC-Einträge zeigen auf dieselben Daten).
+ASSET_LAUNCHER = """
+import json
+import os
+import sys
+import time
+
+import PyInstaller.__main__
+
+# Im Interpreter des Builds prüfen - dessen PYTHONPATH kann ein anderes PyInstaller liefern
+try:
+    from PyInstaller.archive.writers import CArchiveWriter
+    original_write_entry = CArchiveWriter._write_entry
+except (ImportError, AttributeError):
+    CArchiveWriter = None
+    print(
+        "⚠️ Diese PyInstaller-Version unterstützt keine Kompressionsstufen und "
+        "Deduplizierung pro Asset - Daten-Ordner werden normal gebündelt",
+        flush=True,
+    )
+
+with open(os.environ["PYTOEXE_ASSET_PLAN"], encoding="utf-8") as f:
+    plan = json.load(f)
+
+assets = plan["assets"]
+stats = {}
+written = {}
+
+
+def _write_entry(self, fp, entry):
+    dest_name, src_name, compress, typecode = entry
+    asset = assets.get(os.path.normpath(dest_name).replace(os.sep, "/"))
+    if asset is None:
+        return original_write_entry(self, fp, entry)
+
+    cls = stats.setdefault(asset["class"], {
+        "files": 0, "raw": 0, "stored": 0, "seconds": 0.0, "deduplicated": 0, "saved": 0
+    })
+    cls["files"] += 1
+    cls["raw"] += asset["size"]
+
+    digest = asset["hash"]
+    if plan["dedup"] and digest and digest in written:
+        cls["deduplicated"] += 1
+        cls["saved"] += asset["size"]
+        return written[digest][:5] + (os.path.normpath(dest_name),)
+
+    start = time.perf_counter()
+    self._COMPRESSION_LEVEL = asset["level"]
+    try:
+        toc_entry = original_write_entry(
+            self, fp, (dest_name, src_name, compress and asset["level"] > 0, typecode)
+        )
+    finally:
+        del self._COMPRESSION_LEVEL
+    cls["seconds"] += time.perf_counter() - start
+    cls["stored"] += toc_entry[1]
+
+    if digest:
+        written[digest] = toc_entry
+    return toc_entry
+
+
+if CArchiveWriter is not None:
+    CArchiveWriter._write_entry = _write_entry
+
+try:
+    PyInstaller.__main__.run()
+finally:
+    with open(os.environ["PYTOEXE_ASSET_STATS"], "w", encoding="utf-8") as f:
+        json.dump(stats, f)
+"""
+
+
+def classify_asset(path):
+    """Bestimmt die Asset-Klasse anhand der Dateiendung"""
+    ext = os.path.splitext(path)[1].lower()
+    for key, (_, extensions, _) in ASSET_CLASSES.items():
+        if ext in extensions:
+            return key
+    return "other"
+
+
+def discover_data_dirs(script_path):
+    """Findet typische Daten-Ordner im Ordner des Scripts"""
+    base_dir = os.path.dirname(os.path.abspath(script_path))
+    found = []
+    try:
+        entries = sorted(os.listdir(base_dir))
+    except OSError:
+        return found
+    for name in entries:
+        path = os.path.join(base_dir, name)
+        if name.lower() in ASSET_DIR_NAMES and os.path.isdir(path):
+            found.append(path)
+    return found
+
+
+def file_hash(path):
+    """SHA-256 einer Datei, blockweise gelesen"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def plan_assets(data_dirs, script_path, levels, dedup=True):
+    """Erstellt den Asset-Plan: --add-data Ziele, Klassen, Stufen und Hashes für die Deduplizierung"""
+    base_dir = os.path.dirname(os.path.abspath(script_path))
+    
+    # Doppelt oder verschachtelt angegebene Ordner nur einmal deklarieren
+    dirs = []
+    for path in sorted({os.path.abspath(d) for d in data_dirs if os.path.isdir(d)}):
+        if not any(path.startswith(parent + os.sep) for parent in dirs):
+            dirs.append(path)
+    
+    declarations = []
+    files = []
+    for path in dirs:
+        # Ordner im Script-Verzeichnis behalten ihren relativen Pfad, sonst nur den Namen
+        if path.startswith(base_dir + os.sep):
+            dest = os.path.relpath(path, base_dir)
+        else:
+            dest = os.path.basename(path)
+        declarations.append((path, dest))
+        
+        for root, _, names in os.walk(path):
+            for name in sorted(names):
+                src = os.path.join(root, name)
+                rel = os.path.relpath(src, path)
+                files.append((src, os.path.normpath(os.path.join(dest, rel)).replace(os.sep, "/")))
+    
+    # Nur Dateien gleicher Größe können identisch sein - nur diese hashen
+    sizes = {}
+    for src, _ in files:
+        size = os.path.getsize(src)
+        sizes.setdefault(size, []).append(src)
+    
+    assets = {}
+    for src, dest in files:
+        size = os.path.getsize(src)
+        digest = file_hash(src) if dedup and len(sizes[size]) > 1 else None
+        asset_class = classify_asset(src)
+        assets[dest] = {
+            "size": size,
+            "hash": digest,
+            "class": asset_class,
+            "level": levels.get(asset_class, ASSET_CLASSES[asset_class][2]),
+        }
+    
+    return {
+        "declarations": declarations,
+        "assets": assets,
+        "dedup": dedup,
+    }
+
+
+def measure_onefile_extraction(exe_path):
+    """Misst, wie lange das Entpacken des Onefile-Archivs dauert"""
+    from PyInstaller.archive.readers import CArchiveReader
+    
+    reader = CArchiveReader(exe_path)
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp:
+        for index, (name, entry) in enumerate(reader.toc.items()):
+            # Scripts und Module lädt der Bootloader aus dem Speicher
+            if entry[4] in ("o", "d", "n", "s", "m", "M"):
+                continue
+            data = reader.extract(name)
+            with open(os.path.join(tmp, str(index)), "wb") as f:
+                f.write(data)
+    return time.perf_counter() - start
+
+
+def format_size(num_bytes):
+    """Bytes als lesbare Größe"""
+    for unit in ("B", "KB", "MB"):
+        if num_bytes < 1024:
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} GB"
+
+
+BUILD_HISTORY = os.environ.get("PYTOEXE_BUILD_HISTORY") or os.path.join(
+    os.path.dirname(TOOLCHAIN_CACHE), "build_history.json"
+)
+
+# Schätzwerte ohne Historie: (Grundwert, Zuwachs pro MB Abhängigkeiten)
+MB = 1024 * 1024
+ESTIMATE_DEFAULTS = {
+    "seconds": (15.0, 0.4),
+    "size": (8 * MB, 0.45 * MB),
+    "memory": (150 * MB, 1.5 * MB),
+}
+
+_history_lock = threading.Lock()
+_distribution_cache = {}
+_packages_cache = {}
+
+
+def scan_imports(script_path):
+    """Statischer Import-Scan: Top-Level Module des Scripts und lokaler Module daneben"""
+    base_dir = os.path.dirname(os.path.abspath(script_path))
+    found = set()
+    pending = [os.path.abspath(script_path)]
+    scanned = set()
+    
+    while pending:
+        path = pending.pop()
+        if path in scanned:
+            continue
+        scanned.add(path)
+        try:
+            with open(path, encoding="utf-8") as f:
+                tree = ast.parse(f.read(), path)
+        except (OSError, SyntaxError, ValueError):
+            continue
+        
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                top = name.split(".")[0]
+                local = os.path.join(base_dir, top + ".py")
+                if os.path.isfile(local):
+                    pending.append(local)
+                elif top not in sys.stdlib_module_names:
+                    found.add(top)
+    return found
+
+
+def distribution_size(name):
+    """Größe einer installierten Distribution in Bytes (aus RECORD, gecached)"""
+    key = name.lower().replace("_", "-")
+    if key not in _distribution_cache:
+        total = 0
+        try:
+            dist = importlib.metadata.distribution(name)
+            for file in dist.files or []:
+                if file.size:
+                    total += file.size
+                elif not str(file).endswith(".pyc"):
+                    try:
+                        total += os.path.getsize(dist.locate_file(file))
+                    except OSError:
+                        pass
+            requires = dist.requires or []
+        except importlib.metadata.PackageNotFoundError:
+            total, requires = None, []
+        # Extras werden nicht mitgezählt
+        deps = [re.match(r"[A-Za-z0-9._-]+", r).group(0) for r in requires if "extra ==" not in r]
+        _distribution_cache[key] = (total, deps)
+    return _distribution_cache[key]
+
+
+def packages_distributions():
+    """Modul -> Distributionen, neu ermittelt nur wenn sich die Toolchain-Umgebung ändert"""
+    fingerprint = toolchain.fingerprint()
+    if _packages_cache.get("fingerprint") != fingerprint:
+        _packages_cache["mapping"] = importlib.metadata.packages_distributions()
+        _packages_cache["fingerprint"] = fingerprint
+        _distribution_cache.clear()
+    return _packages_cache["mapping"]
+
+
+def dependency_sizes(modules):
+    """Installierte Distributionen (inkl. Abhängigkeiten) der Module und ihre Größe"""
+    mapping = packages_distributions()
+    pending = [dist for module in modules for dist in mapping.get(module, [])]
+    sizes = {}
+    while pending:
+        name = pending.pop()
+        key = name.lower().replace("_", "-")
+        if key in sizes:
+            continue
+        total, deps = distribution_size(name)
+        if total is None:
+            continue
+        sizes[key] = total
+        pending.extend(deps)
+    return sizes
+
+
+def load_build_history():
+    try:
+        with open(BUILD_HISTORY, encoding="utf-8") as f:
+            history = json.load(f)
+    except (OSError, ValueError):
+        return []
+    # Beschädigte oder fremde Einträge ignorieren
+    if not isinstance(history, list):
+        return []
+    return [h for h in history if isinstance(h, dict) and isinstance(h.get("deps_mb"), (int, float))]
+
+
+def predict(metric, x, samples):
+    """Lineare Schätzung über die Abhängigkeits-Größe (MB) aus der Historie"""
+    base, slope = ESTIMATE_DEFAULTS[metric]
+    points = [(s["deps_mb"], s[metric]) for s in samples if s.get(metric)]
+    if not points:
+        return base + slope * x
+    
+    # Ab zwei verschiedenen Größen eigene Steigung, sonst Standard-Steigung um den Mittelwert
+    mean_x = sum(p[0] for p in points) / len(points)
+    mean_y = sum(p[1] for p in points) / len(points)
+    var_x = sum((p[0] - mean_x) ** 2 for p in points)
+    if var_x > 0:
+        slope = max(sum((p[0] - mean_x) * (p[1] - mean_y) for p in points) / var_x, 0.0)
+    return max(mean_y + slope * (x - mean_x), 0.0)
+
+
+def estimate_build(script_path, onefile=True, data_dirs=(), clean=True):
+    """Schätzt Dauer, Größe und Spitzen-Speicher eines Builds vor dem Start"""
+    sizes = dependency_sizes(scan_imports(script_path))
+    assets = sum(
+        os.path.getsize(os.path.join(root, name))
+        for path in data_dirs if os.path.isdir(path)
+        for root, _, names in os.walk(path) for name in names
+    )
+    deps_mb = (sum(sizes.values()) + assets) / MB
+    
+    # Ähnliche Builds: gleicher Modus, Clean oder inkrementell, nächste Abhängigkeits-Größe
+    # (Einträge ohne "clean" stammen aus der Zeit, als --clean Standard war)
+    history = [
+        h for h in load_build_history()
+        if h.get("onefile") == onefile and h.get("clean", True) == clean
+    ]
+    samples = sorted(history, key=lambda h: abs(h["deps_mb"] - deps_mb))[:10]
+    
+    return {
+        "deps_mb": deps_mb,
+        "onefile": onefile,
+        "clean": clean,
+        "distributions": sorted(sizes),
+        "samples": len(samples),
+        "seconds": predict("seconds", deps_mb, samples),
+        "size": predict("size", deps_mb, samples),
+        "memory": predict("memory", deps_mb, samples),
+    }
+
+
+def record_build(estimate, seconds, size, memory):
+    """Speichert die tatsächlichen Werte eines Builds für künftige Schätzungen"""
+    entry = {
+        "deps_mb": estimate["deps_mb"],
+        "onefile": estimate["onefile"],
+        "clean": estimate.get("clean", True),
+        "seconds": seconds,
+        "size": size,
+        "memory": memory,
+        "time": time.time(),
+    }
+    with _history_lock:
+        history = load_build_history()[-199:] + [entry]
+        try:
+            os.makedirs(os.path.dirname(BUILD_HISTORY), exist_ok=True)
+            with open(BUILD_HISTORY, "w", encoding="utf-8") as f:
+                json.dump(history, f)
+        except OSError:
+            pass
+
+
+def format_estimate(estimate):
+    """Kurztext für die UI"""
+    basis = f"{estimate['samples']} ähnliche Builds" if estimate["samples"] else "grobe Schätzung"
+    return (
+        f"⏱️ ~{estimate['seconds']:.0f}s   📦 ~{format_size(estimate['size'])}   "
+        f"🧠 ~{format_size(estimate['memory'])} RAM   ({basis})"
+    )
+
+
+def windows_peak_memory(process):
+    """Spitzen-Speicher (PeakWorkingSetSize) eines Windows-Prozesses in Bytes"""
+    import ctypes
+    from ctypes import wintypes
+    
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+    
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    handle = wintypes.HANDLE(int(process._handle))
+    if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+        return counters.PeakWorkingSetSize
+    return None
+
+
+def watch_peak_memory(process, interval=0.2):
+    """Beobachtet den laufenden Build-Prozess selbst. Liefert eine Funktion, die nach
+    dessen Ende den Spitzen-Speicher in Bytes zurückgibt (None falls unbekannt)"""
+    if sys.platform == "win32":
+        def result():
+            try:
+                return windows_peak_memory(process)
+            except Exception:
+                return None
+        return result
+    
+    # Linux: Höchststand (VmHWM) aus /proc lesen, solange der Prozess lebt.
+    # Sonst nichts melden - RUSAGE_CHILDREN mischt frühere Builds, pip und UPX mit ein.
+    status_path = f"/proc/{process.pid}/status"
+    if not os.path.exists(status_path):
+        return lambda: None
+    
+    peak = [None]
+    
+    def poll():
+        while process.poll() is None:
+            try:
+                with open(status_path, encoding="ascii") as f:
+                    for line in f:
+                        if line.startswith("VmHWM:"):
+                            value = int(line.split()[1]) * 1024
+                            peak[0] = max(peak[0] or 0, value)
+                            break
+            except (OSError, ValueError):
+                break
+            time.sleep(interval)
+    
+    thread = threading.Thread(target=poll, daemon=True)
+    thread.start()
+    
+    def result():
+        thread.join()
+        return peak[0]
+    return result
+
+
 class BuildWorker(QThread):
     """Worker Thread für den Build-Prozess"""
     output = pyqtSignal(str)
@@ -186,11 +903,35 @@ class BuildWorker(QThread):
         self.options = options
         self.process = None
         self._cancelled = False
+        self._asset_dir = None
+        self.duration = None
+        self.peak_memory = None
     
     def run(self):
         try:
+            # PyInstaller direkt oder über den Asset-Launcher starten
+            runner = ["-m", "PyInstaller"]
+            env = None
+            stats_path = None
+            assets = self.options.get("assets")
+            if assets:
+                # Der Launcher fällt selbst auf PyInstaller ohne Hook zurück (vor 6.0)
+                runner, env, stats_path = self.prepare_asset_launcher(assets)
+            
+            # Zusätzliche Umgebungsvariablen, z.B. eigener PyInstaller-Cache pro Job
+            if self.options.get("env"):
+                env = dict(env or os.environ, **self.options["env"])
+            
             # PyInstaller Befehl zusammenbauen
-            cmd = [sys.executable, "-m", "PyInstaller"]
+            cmd = [sys.executable] + runner
+            
+            # Profiling: PyInstaller unter cProfile ausführen
+            profile_path = None
+            if self.options.get("profile"):
+                profile_dir = self.output_dir or os.getcwd()
+                os.makedirs(profile_dir, exist_ok=True)
+                profile_path = os.path.join(profile_dir, self.base_name() + "_build.prof")
+                cmd = [sys.executable, "-m", "cProfile", "-o", profile_path] + runner
             
             # Optionen
             if self.options.get("onefile"):
@@ -208,6 +949,16 @@ class BuildWorker(QThread):
             if self.output_dir:
                 cmd.extend(["--distpath", self.output_dir])
             
+            # Eigenes Arbeitsverzeichnis (build/ und .spec), z.B. für parallele Jobs
+            if self.options.get("workdir"):
+                cmd.extend([
+                    "--workpath", os.path.join(self.options["workdir"], "build"),
+                    "--specpath", self.options["workdir"]
+                ])
+            
+            if self.options.get("upx_dir"):
+                cmd.extend(["--upx-dir", self.options["upx_dir"]])
+            
             # Icon falls angegeben
             if self.options.get("icon"):
                 cmd.extend(["--icon", self.options["icon"]])
@@ -216,22 +967,34 @@ class BuildWorker(QThread):
             if self.options.get("noconsole"):
                 cmd.append("--noconsole")
             
+            # Daten-Ordner
+            if assets:
+                for src, dest in assets["declarations"]:
+                    cmd.extend(["--add-data", f"{src}{os.pathsep}{dest}"])
+            
             # Script
             cmd.append(self.script_path)
             
             self.output.emit(f"Starte Build...\n")
             self.output.emit(f"Befehl: {' '.join(cmd)}\n")
+            if assets:
+                self.output.emit(
+                    f"Assets: {len(assets['assets'])} Dateien aus {len(assets['declarations'])} Ordner(n)\n"
+                )
             self.output.emit("-" * 50 + "\n")
             
             # Prozess starten
+            start = time.perf_counter()
             self.process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 text=True,
                 bufsize=1,
-                universal_newlines=True
+                universal_newlines=True,
+                env=env
             )
+            peak_memory = watch_peak_memory(self.process)
             
             # Output lesen
             for line in self.process.stdout:
@@ -242,18 +1005,103 @@ class BuildWorker(QThread):
                 self.output.emit(line)
             
             self.process.wait()
+            duration = time.perf_counter() - start
+            self.duration = duration
+            self.peak_memory = peak_memory()
+            
+            # Profil auswerten (auch bei fehlgeschlagenem Build aufschlussreich)
+            if profile_path and os.path.exists(profile_path):
+                self.emit_profile_summary(profile_path)
             
             if self.process.returncode == 0:
                 exe_path = os.path.join(
                     self.output_dir or "dist",
-                    (self.exe_name or os.path.splitext(os.path.basename(self.script_path))[0]) + ".exe"
+                    self.base_name() + ".exe"
                 )
+                if assets:
+                    self.emit_asset_report(assets, stats_path, exe_path, duration)
                 self.finished.emit(True, exe_path)
             else:
                 self.finished.emit(False, f"Build fehlgeschlagen (Code: {self.process.returncode})")
                 
         except Exception as e:
             self.finished.emit(False, str(e))
+        finally:
+            if self._asset_dir:
+                shutil.rmtree(self._asset_dir, ignore_errors=True)
+    
+    def base_name(self):
+        """Name der EXE ohne Endung"""
+        return self.exe_name or os.path.splitext(os.path.basename(self.script_path))[0]
+    
+    def emit_profile_summary(self, profile_path):
+        """Gibt die Profil-Rangliste im Build Log aus"""
+        try:
+            lines = summarize_profile(profile_path)
+        except Exception as e:
+            self.output.emit(f"⚠️ Profil konnte nicht ausgewertet werden: {e}\n")
+            return
+        
+        self.output.emit("-" * 50 + "\n")
+        for line in lines:
+            self.output.emit(line + "\n")
+        self.output.emit(f"📊 Profil gespeichert: {profile_path}\n")
+        self.output.emit("-" * 50 + "\n")
+    
+    def prepare_asset_launcher(self, assets):
+        """Schreibt Launcher und Asset-Plan in ein temporäres Verzeichnis"""
+        self._asset_dir = tempfile.mkdtemp(prefix="pytoexe_assets_")
+        
+        launcher_path = os.path.join(self._asset_dir, "asset_launcher.py")
+        with open(launcher_path, "w", encoding="utf-8") as f:
+            f.write(ASSET_LAUNCHER)
+        
+        plan_path = os.path.join(self._asset_dir, "plan.json")
+        with open(plan_path, "w", encoding="utf-8") as f:
+            json.dump({"assets": assets["assets"], "dedup": assets["dedup"]}, f)
+        
+        stats_path = os.path.join(self._asset_dir, "stats.json")
+        env = dict(os.environ, PYTOEXE_ASSET_PLAN=plan_path, PYTOEXE_ASSET_STATS=stats_path)
+        return [launcher_path], env, stats_path
+    
+    def emit_asset_report(self, assets, stats_path, exe_path, duration):
+        """Gibt die Wirkung der Asset-Pipeline im Build Log aus"""
+        self.output.emit("-" * 50 + "\n")
+        self.output.emit("Asset-Bericht:\n")
+        
+        total = sum(asset["size"] for asset in assets["assets"].values())
+        self.output.emit(f"  Dateien: {len(assets['assets'])} ({format_size(total)})\n")
+        
+        # Statistik aus dem Launcher (nur vorhanden, wenn ein Onefile-Archiv geschrieben wurde)
+        stats = {}
+        if stats_path and os.path.exists(stats_path):
+            with open(stats_path, encoding="utf-8") as f:
+                stats = json.load(f)
+        
+        # Geteilte Daten gibt es nur im Onefile-Archiv
+        deduplicated = sum(cls["deduplicated"] for cls in stats.values())
+        if self.options.get("onefile") and deduplicated:
+            saved = sum(cls["saved"] for cls in stats.values())
+            self.output.emit(f"  Duplikate: {deduplicated} ({format_size(saved)} nur einmal gespeichert)\n")
+        
+        for key, cls in stats.items():
+            label = ASSET_CLASSES[key][0]
+            level = next(a["level"] for a in assets["assets"].values() if a["class"] == key)
+            self.output.emit(
+                f"  {label}: {cls['files']} Dateien, {format_size(cls['raw'])} → "
+                f"{format_size(cls['stored'])} (Stufe {level}, {cls['seconds']:.2f}s)\n"
+            )
+        
+        self.output.emit(f"  Build-Dauer: {duration:.1f}s\n")
+        if os.path.exists(exe_path):
+            self.output.emit(f"  EXE-Größe: {format_size(os.path.getsize(exe_path))}\n")
+            if self.options.get("onefile"):
+                try:
+                    seconds = measure_onefile_extraction(exe_path)
+                    self.output.emit(f"  Onefile-Entpackzeit (gemessen): {seconds:.2f}s\n")
+                except Exception as e:
+                    self.output.emit(f"  ⚠️ Entpackzeit nicht messbar: {e}\n")
+        self.output.emit("-" * 50 + "\n")
     
     def cancel(self):
         self._cancelled = True
@@ -265,6 +1113,15 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.worker = None
+        self.estimate = None
+        self.build_estimate = None
+        
+        # Schätzung erst nach einer kurzen Tipp-Pause neu berechnen
+        self.estimate_timer = QTimer(self)
+        self.estimate_timer.setSingleShot(True)
+        self.estimate_timer.setInterval(400)
+        self.estimate_timer.timeout.connect(self.update_estimate)
+        
         self.init_ui()
     
     def init_ui(self):
@@ -323,6 +1180,18 @@ class MainWindow(QMainWindow):
         icon_btn.clicked.connect(self.browse_icon)
         input_layout.addWidget(icon_btn, 1, 2)
         
+        # Daten-Ordner (optional)
+        input_layout.addWidget(QLabel("Daten-Ordner:"), 2, 0)
+        self.data_input = QLineEdit()
+        self.data_input.setPlaceholderText("Optional: Ordner mit Assets, getrennt durch ;")
+        self.data_input.textChanged.connect(lambda *_: self.estimate_timer.start())
+        input_layout.addWidget(self.data_input, 2, 1)
+        
+        data_btn = QPushButton("📁")
+        data_btn.setObjectName("browse_btn")
+        data_btn.clicked.connect(self.browse_data_dir)
+        input_layout.addWidget(data_btn, 2, 2)
+        
         layout.addWidget(input_group)
         
         # Output Gruppe
@@ -361,6 +1230,7 @@ class MainWindow(QMainWindow):
         self.onefile_check.setChecked(True)
         self.onefile_check.setToolTip("Alles in eine einzige EXE packen")
         self.onefile_check.stateChanged.connect(lambda: self.update_checkbox_style(self.onefile_check))
+        self.onefile_check.stateChanged.connect(lambda *_: self.estimate_timer.start())
         self.update_checkbox_style(self.onefile_check)
         left_checks.addWidget(self.onefile_check)
         
@@ -378,6 +1248,7 @@ class MainWindow(QMainWindow):
         self.clean_check.setChecked(True)
         self.clean_check.setToolTip("Löscht temporäre Dateien vor dem Build")
         self.clean_check.stateChanged.connect(lambda: self.update_checkbox_style(self.clean_check))
+        self.clean_check.stateChanged.connect(lambda *_: self.estimate_timer.start())
         self.update_checkbox_style(self.clean_check)
         right_checks.addWidget(self.clean_check)
         
@@ -414,8 +1285,48 @@ class MainWindow(QMainWindow):
         checks_layout2.addLayout(right_checks2)
         options_layout.addLayout(checks_layout2)
         
+        # Dritte Reihe Optionen
+        checks_layout3 = QHBoxLayout()
+        
+        self.profile_check = QCheckBox("  Build profilieren (cProfile)")
+        self.profile_check.setChecked(False)
+        self.profile_check.setToolTip("Misst, wie viel Zeit Hooks, Modul-Graph, Binär-Analyse und Kompression brauchen")
+        self.profile_check.stateChanged.connect(lambda: self.update_checkbox_style(self.profile_check))
+        self.update_checkbox_style(self.profile_check)
+        checks_layout3.addWidget(self.profile_check)
+        
+        self.dedup_check = QCheckBox("  Identische Assets nur einmal speichern")
+        self.dedup_check.setChecked(True)
+        self.dedup_check.setToolTip("Gleiche Dateien (per Hash) teilen sich im Onefile-Archiv dieselben Daten")
+        self.dedup_check.stateChanged.connect(lambda: self.update_checkbox_style(self.dedup_check))
+        self.update_checkbox_style(self.dedup_check)
+        checks_layout3.addWidget(self.dedup_check)
+        
+        options_layout.addLayout(checks_layout3)
+        
+        # Kompressionsstufe je Asset-Klasse (0 = nicht komprimieren)
+        levels_layout = QHBoxLayout()
+        levels_layout.addWidget(QLabel("Asset-Kompression:"))
+        self.level_spins = {}
+        for key, (label, _, default_level) in ASSET_CLASSES.items():
+            levels_layout.addWidget(QLabel(f"{label}:"))
+            spin = QSpinBox()
+            spin.setRange(0, 9)
+            spin.setValue(default_level)
+            spin.setToolTip("zlib-Stufe im Onefile-Archiv (0 = unkomprimiert)")
+            levels_layout.addWidget(spin)
+            self.level_spins[key] = spin
+        levels_layout.addStretch()
+        options_layout.addLayout(levels_layout)
+        
         layout.addWidget(options_group)
         
+        # Schätzung vor dem Build
+        self.estimate_label = QLabel("")
+        self.estimate_label.setObjectName("estimate_label")
+        self.estimate_label.setToolTip("Aus Import-Scan, installierten Paketen und bisherigen Builds")
+        layout.addWidget(self.estimate_label)
+        
         # Build Button
         btn_layout = QHBoxLayout()
         
@@ -581,6 +1492,8 @@ $Shortcut.Save()
             if not self.name_input.text():
                 base_name = os.path.splitext(os.path.basename(path))[0]
                 self.name_input.setText(base_name)
+            if not self.data_input.text():
+                self.data_input.setText(";".join(discover_data_dirs(path)))
     
     def browse_icon(self):
         path, _ = QFileDialog.getOpenFileName(
@@ -592,7 +1505,18 @@ $Shortcut.Save()
         if path:
             self.icon_input.setText(path)
     
-    def convert_to_ico(self, image_path):
+    def browse_data_dir(self):
+        path = QFileDialog.getExistingDirectory(
+            self,
+            "Daten-Ordner wählen"
+        )
+        if path:
+            dirs = [d for d in self.data_input.text().split(";") if d.strip()]
+            if path not in dirs:
+                dirs.append(path)
+            self.data_input.setText(";".join(dirs))
+    
+    def convert_to_ico(self, image_path, _retried=False):
         """Konvertiert PNG/JPG/BMP zu ICO falls nötig"""
         if image_path.lower().endswith('.ico'):
             return image_path
@@ -634,9 +1558,17 @@ $Shortcut.Save()
             return ico_path
             
         except ImportError:
+            # Nur ein Installationsversuch, danach aufgeben
+            if _retried or toolchain.get("Pillow"):
+                self.log_output.append("⚠️ Pillow nicht verfügbar, Icon wird übersprungen\n")
+                return None
             self.log_output.append("⚠️ Pillow nicht installiert, installiere...\n")
-            subprocess.run([sys.executable, "-m", "pip", "install", "Pillow"])
-            return self.convert_to_ico(image_path)
+            try:
+                toolchain.install(["Pillow"])
+            except subprocess.CalledProcessError:
+                self.log_output.append("⚠️ Pillow konnte nicht installiert werden\n")
+                return None
+            return self.convert_to_ico(image_path, _retried=True)
         except Exception as e:
             self.log_output.append(f"⚠️ Icon-Konvertierung fehlgeschlagen: {e}\n")
             return None
@@ -651,6 +1583,28 @@ $Shortcut.Save()
     
     def on_script_changed(self, text):
         self.build_btn.setEnabled(bool(text and os.path.isfile(text)))
+        self.estimate_timer.start()
+    
+    def data_dirs(self):
+        return [d.strip() for d in self.data_input.text().split(";") if d.strip()]
+    
+    def update_estimate(self):
+        """Zeigt geschätzte Dauer, Größe und Spitzen-Speicher vor dem Build"""
+        script = self.script_input.text()
+        if not script or not os.path.isfile(script):
+            self.estimate = None
+            self.estimate_label.setText("")
+            return
+        
+        try:
+            self.estimate = estimate_build(
+                script, self.onefile_check.isChecked(), self.data_dirs(), self.clean_check.isChecked()
+            )
+        except Exception as e:
+            self.estimate = None
+            self.estimate_label.setText(f"⚠️ Schätzung nicht möglich: {e}")
+            return
+        self.estimate_label.setText(format_estimate(self.estimate))
     
     def start_build(self):
         script = self.script_input.text()
@@ -659,38 +1613,48 @@ $Shortcut.Save()
             QMessageBox.warning(self, "Fehler", "Bitte wähle ein gültiges Python Script.")
             return
         
-        # PyInstaller prüfen
-        try:
-            subprocess.run(
-                [sys.executable, "-m", "PyInstaller", "--version"],
-                capture_output=True,
-                check=True
-            )
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        # PyInstaller prüfen (aus dem Toolchain-Cache, ohne Subprozess)
+        if not toolchain.get("PyInstaller"):
             reply = QMessageBox.question(
                 self,
                 "PyInstaller nicht gefunden",
                 "PyInstaller ist nicht installiert.\n\nJetzt installieren?",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
-            if reply == QMessageBox.StandardButton.Yes:
-                self.log_output.append("Installiere PyInstaller...\n")
-                subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller"])
-                self.log_output.append("PyInstaller installiert!\n\n")
-            else:
+            if reply != QMessageBox.StandardButton.Yes:
                 return
+            self.log_output.append("Installiere PyInstaller...\n")
+            try:
+                toolchain.install(["PyInstaller"])
+            except subprocess.CalledProcessError as e:
+                QMessageBox.warning(self, "Fehler", f"PyInstaller konnte nicht installiert werden: {e}")
+                return
+            self.log_output.append("PyInstaller installiert!\n\n")
         
         # Icon konvertieren falls nötig
         icon_path = self.icon_input.text() if self.icon_input.text() else None
         if icon_path and not icon_path.lower().endswith('.ico'):
             icon_path = self.convert_to_ico(icon_path)
         
+        # Assets planen (Duplikate, Asset-Klassen, Kompressionsstufen)
+        assets = None
+        data_dirs = self.data_dirs()
+        if data_dirs:
+            levels = {key: spin.value() for key, spin in self.level_spins.items()}
+            assets = plan_assets(data_dirs, script, levels, self.dedup_check.isChecked())
+        
+        # UPX ist optional - PyInstaller nutzt es nur, wenn es gefunden wird
+        upx = toolchain.get("UPX")
+        
         # Optionen sammeln
         options = {
             "onefile": self.onefile_check.isChecked(),
             "windowed": self.windowed_check.isChecked(),
             "clean": self.clean_check.isChecked(),
-            "icon": icon_path
+            "icon": icon_path,
+            "profile": self.profile_check.isChecked(),
+            "assets": assets,
+            "upx_dir": os.path.dirname(upx["path"]) if upx else None
         }
         
         # UI anpassen
@@ -700,6 +1664,12 @@ $Shortcut.Save()
         self.status_label.setText("Build läuft...")
         self.log_output.clear()
         
+        # Schätzung für den Vergleich nach dem Build merken (ausstehende sofort berechnen)
+        if self.estimate_timer.isActive():
+            self.estimate_timer.stop()
+            self.update_estimate()
+        self.build_estimate = self.estimate
+        
         # Worker starten
         self.worker = BuildWorker(
             script,
@@ -743,6 +1713,16 @@ $Shortcut.Save()
             if self.shortcut_check.isChecked():
                 self.create_desktop_shortcut(exe_path)
             
+            # Tatsächliche Werte für künftige Schätzungen speichern
+            # (nicht bei profilierten Builds - cProfile verlangsamt PyInstaller um ein Vielfaches)
+            if self.build_estimate and self.worker.duration and not self.worker.options.get("profile"):
+                size = os.path.getsize(exe_path) if os.path.isfile(exe_path) else None
+                record_build(self.build_estimate, self.worker.duration, size, self.worker.peak_memory)
+                self.log_output.append(
+                    f"⏱️ Dauer: {self.worker.duration:.0f}s (geschätzt ~{self.build_estimate['seconds']:.0f}s)"
+                )
+                self.update_estimate()
+            
             self.status_label.setText(f"✅ Erfolgreich: {os.path.basename(exe_path)}")
             self.status_label.setStyleSheet("color: #4caf50; font-weight: bold;")
             
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Stub-PyInstaller für Benchmark und Build-Server-Selbsttest
+Ersetzt "python -m PyInstaller": spielt ein aufgezeichnetes Log mit einstellbarer
+Rate ab und legt danach eine kleine Dummy-EXE an. Kein Build, keine Abhängigkeiten.
+
+    stub_dir, env = install_stub(workspace, log_path, rate=2000)
+    subprocess.run([sys.executable, "-m", "PyInstaller", ...], env=dict(os.environ, **env))
+"""
+
+import os
+
+
+STUB_MAIN = """
+import os
+import sys
+import time
+
+
+def run():
+    args = sys.argv[1:]
+    if "--version" in args:
+        print("6.0.0-stub")
+        return
+
+    with open(os.environ["PYTOEXE_STUB_LOG"], encoding="utf-8") as f:
+        lines = f.readlines()
+
+    rate = float(os.environ.get("PYTOEXE_STUB_RATE", "0"))
+    start = time.perf_counter()
+    for index, line in enumerate(lines):
+        if rate:
+            delay = start + index / rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        sys.stdout.write(line)
+        sys.stdout.flush()
+
+    # Onefile: Daten-Dateien wie PyInstaller über CArchiveWriter._write_entry schreiben,
+    # damit ein gepatchter Writer (Asset-Launcher) dieselben Aufrufe sieht
+    if "--onefile" in args:
+        from PyInstaller.archive.writers import CArchiveWriter
+        writer = CArchiveWriter()
+        for index, arg in enumerate(args[:-1]):
+            if arg != "--add-data":
+                continue
+            src, dest = args[index + 1].rsplit(os.pathsep, 1)
+            for root, _, names in os.walk(src):
+                for name in sorted(names):
+                    path = os.path.join(root, name)
+                    dest_name = os.path.join(dest, os.path.relpath(path, src))
+                    writer._write_entry(None, (dest_name, path, True, "x"))
+
+    script = args[-1]
+    name = args[args.index("--name") + 1] if "--name" in args else os.path.splitext(os.path.basename(script))[0]
+    distpath = args[args.index("--distpath") + 1] if "--distpath" in args else "dist"
+    os.makedirs(distpath, exist_ok=True)
+    with open(os.path.join(distpath, name + ".exe"), "wb") as f:
+        f.write(b"MZ" + b"\\0" * 1024)
+
+
+if __name__ == "__main__":
+    run()
+"""
+
+# Damit auch der Asset-Launcher (ASSET_LAUNCHER) gegen den Stub läuft.
+# Der Stub schreibt kein Archiv - _write_entry liefert nur den TOC-Eintrag (unkomprimiert).
+STUB_ARCHIVE_WRITERS = """
+import os
+
+
+class CArchiveWriter:
+    def _write_entry(self, fp, entry):
+        dest_name, src_name, compress, typecode = entry
+        size = os.path.getsize(src_name)
+        return (0, size, size, 0, typecode, dest_name)
+"""
+
+# Zeilen im Stil eines echten PyInstaller Logs
+SYNTHETIC_LOG_LINES = [
+    "{ms} INFO: Analyzing hidden import 'pkg_{i}.submodule'\n",
+    "{ms} INFO: Processing standard module hook 'hook-pkg_{i}.py' from '/site-packages/PyInstaller/hooks'\n",
+    "{ms} INFO: Looking for dynamic libraries\n",
+    "{ms} INFO: Extra DLL search directories (PATH): ['C:\\\\Python\\\\DLLs\\\\lib_{i}']\n",
+    "{ms} WARNING: Library not found: could not resolve 'lib_{i}.dll'\n",
+]
+
+
+def write_synthetic_log(path, count):
+    """Erzeugt ein PyInstaller-artiges Log mit count Zeilen"""
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(count):
+            template = SYNTHETIC_LOG_LINES[i % len(SYNTHETIC_LOG_LINES)]
+            f.write(template.format(ms=i // 10, i=i))
+
+
+def install_stub(workspace, log_path, rate=0):
+    """Legt das Stub-Paket in workspace/stub an und liefert (stub_dir, Umgebungsvariablen)"""
+    stub_dir = os.path.join(workspace, "stub")
+    package = os.path.join(stub_dir, "PyInstaller")
+    os.makedirs(os.path.join(package, "archive"), exist_ok=True)
+    open(os.path.join(package, "__init__.py"), "w").close()
+    with open(os.path.join(package, "__main__.py"), "w", encoding="utf-8") as f:
+        f.write(STUB_MAIN)
+    open(os.path.join(package, "archive", "__init__.py"), "w").close()
+    with open(os.path.join(package, "archive", "writers.py"), "w", encoding="utf-8") as f:
+        f.write(STUB_ARCHIVE_WRITERS)
+
+    env = {
+        "PYTHONPATH": os.pathsep.join(
+            [stub_dir] + [p for p in os.environ.get("PYTHONPATH", "").split(os.pathsep) if p]
+        ),
+        "PYTOEXE_STUB_LOG": log_path,
+        "PYTOEXE_STUB_RATE": str(rate),
+    }
+    return stub_dir, env